@@ -0,0 +1,95 @@
+import os
+import sys
+import time
+import random
+import bson
+from pymongo import MongoClient
+from pymongo.errors import OperationFailure
+from dotenv import load_dotenv
+from services import content_store
+from services.content_generator import generate_mock_content, generate_mock_parent_updates
+from migrate_content_store import migrate, BODY_FIELDS
+
+# Seeds a scratch database with inline bodies, measures storage size and
+# per-project read latency, migrates to the blob store and measures again.
+# Each project draws its own subject, level, topics and class list, so bodies
+# only repeat where two projects happen to cover the same lesson.
+# The scratch database is dropped afterwards. Pass inline_threshold to override
+# content_store.INLINE_THRESHOLD (0 moves every body to the blob store).
+# Usage: python bench_content_store.py [projects] [seed] [inline_threshold]
+
+load_dotenv()
+
+MONGO_URI = os.getenv("MONGODB_URI", "mongodb://localhost:27017/")
+DATABASE_NAME = "bench_content_store"
+SUBJECTS = {
+    "Math": ["Fractions", "Decimals", "Geometry", "Algebra", "Probability", "Ratios", "Statistics", "Measurement"],
+    "Science": ["Photosynthesis", "The Water Cycle", "Volcanoes", "Magnetism", "Cells", "Ecosystems", "Electricity", "Weather"],
+    "English": ["Poetry", "Persuasive Writing", "Grammar", "Short Stories", "Myths", "Book Reports", "Spelling", "Drama"],
+    "History": ["Ancient Egypt", "The Romans", "World War I", "The Industrial Revolution", "Exploration", "Civil Rights", "The Cold War", "Medieval Europe"],
+}
+LEVELS = [f"Grade {grade}" for grade in range(1, 13)]
+FIRST_NAMES = ["Alice", "Ben", "Chloe", "Daniel", "Emma", "Farah", "George", "Hana", "Ivan", "Jade", "Kofi", "Lena", "Mateo", "Nia", "Omar", "Priya", "Quinn", "Ravi", "Sofia", "Tom"]
+LAST_NAMES = ["Adams", "Brown", "Chen", "Diaz", "Evans", "Fischer", "Garcia", "Haddad", "Ito", "Jones", "Kim", "Lopez", "Moreau", "Nguyen", "Okafor", "Patel"]
+
+def seed(db, projects, rng):
+    project_ids = []
+    for p in range(projects):
+        project_id = f"project-{p}"
+        project_ids.append(project_id)
+        subject = rng.choice(list(SUBJECTS))
+        level = rng.choice(LEVELS)
+        for topic in rng.sample(SUBJECTS[subject], rng.randint(2, 6)):
+            content = generate_mock_content(subject, level, topic)
+            db.lesson_plans.insert_one({"projectId": project_id, "fileName": f"{subject}-{level}-{topic}-LessonPlan.md", "content": content["lesson_plan"], "exportFormat": "pdf"})
+            db.worksheets.insert_one({"projectId": project_id, "fileName": f"{subject}-{level}-{topic}-Worksheet.md", "content": content["worksheet"], "exportFormat": "pdf"})
+        students = [f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}" for _ in range(rng.randint(15, 35))]
+        csv_data = "Name,Score\n" + "\n".join(f"{name},{rng.randint(40, 100)}" for name in students)
+        for update in generate_mock_parent_updates(csv_data):
+            student_name = update.replace("Update for ", "").split(":")[0].strip()
+            db.parent_updates.insert_one({"projectId": project_id, "studentName": student_name, "fileName": f"{student_name}-ParentUpdate.txt", "draftText": update})
+    for collection_name, _ in BODY_FIELDS:
+        db[collection_name].create_index("projectId")
+    return project_ids
+
+def storage_size(db):
+    """Return (BSON data bytes, on-disk bytes or None) over the body collections."""
+    names = [name for name, _ in BODY_FIELDS] + ["blobs"]
+    data_size = sum(len(bson.encode(doc)) for name in names for doc in db[name].find())
+    try:
+        storage = sum(db.command("collStats", name)["storageSize"] for name in names)
+    except OperationFailure:
+        storage = None
+    return data_size, storage
+
+def read_latency(db, project_ids):
+    start = time.perf_counter()
+    for project_id in project_ids:
+        groups = [(list(db[name].find({"projectId": project_id})), field) for name, field in BODY_FIELDS]
+        content_store.resolve(db, groups)
+    return (time.perf_counter() - start) / len(project_ids) * 1000
+
+def report(label, db, project_ids):
+    data_size, storage = storage_size(db)
+    latency = read_latency(db, project_ids)
+    storage_kib = f"{storage / 1024:.1f}" if storage is not None else "n/a"
+    print(f"{label:>8} {data_size / 1024:>12.1f} {storage_kib:>12} {latency:>14.2f}")
+
+if __name__ == "__main__":
+    projects = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    rng = random.Random(int(sys.argv[2]) if len(sys.argv) > 2 else 0)
+    if len(sys.argv) > 3:
+        content_store.INLINE_THRESHOLD = int(sys.argv[3])
+    client = MongoClient(MONGO_URI)
+    db = client[DATABASE_NAME]
+    client.drop_database(DATABASE_NAME)
+    try:
+        project_ids = seed(db, projects, rng)
+        print(f"{'layout':>8} {'data KiB':>12} {'storage KiB':>12} {'ms/project':>14}")
+        report("inline", db, project_ids)
+        migrate(db)
+        report("blobs", db, project_ids)
+        print(f"blobs: {db.blobs.count_documents({})} distinct bodies (inline threshold {content_store.INLINE_THRESHOLD} bytes)")
+    finally:
+        client.drop_database(DATABASE_NAME)
+        client.close()
@@ -0,0 +1,135 @@
+import os
+import sys
+import time
+import tempfile
+import threading
+import subprocess
+import urllib.error
+import urllib.request
+from multiprocessing import Pool
+import jwt
+from pymongo import MongoClient
+from dotenv import load_dotenv
+
+# Measures GET /api/v1/projects/{id} throughput with 1..N uvicorn workers.
+# The server and the load generator are pinned to disjoint CPU sets so the
+# clients never compete with the workers being measured; by default half of
+# the available CPUs go to each side.
+# Requires MONGODB_URI and a built frontend (main.py mounts frontend/dist).
+# Usage: python bench_workers.py [max_workers] [seconds_per_run]
+
+load_dotenv()
+
+MONGO_URI = os.getenv("MONGODB_URI", "mongodb://localhost:27017/")
+DATABASE_NAME = "bench_workers"
+PORT = 8765
+BASE_URL = f"http://127.0.0.1:{PORT}"
+THREADS_PER_CLIENT = 8
+WARMUP_SECONDS = 2
+
+def seed(db):
+    email = "bench@example.com"
+    user_id = db.users.insert_one({"email": email, "hashed_password": "x", "full_name": "Bench"}).inserted_id
+    project_id = str(db.projects.insert_one({"name": "Bench Project", "userId": str(user_id)}).inserted_id)
+    for i in range(5):
+        db.lesson_plans.insert_one({"projectId": project_id, "fileName": f"lp-{i}.md", "content": "# Lesson\n" * 50, "exportFormat": "pdf"})
+        db.worksheets.insert_one({"projectId": project_id, "fileName": f"ws-{i}.md", "content": "# Worksheet\n" * 50, "exportFormat": "pdf"})
+        db.parent_updates.insert_one({"projectId": project_id, "studentName": f"S{i}", "fileName": f"S{i}.txt", "draftText": f"Update for S{i}: Their score was {i}."})
+    token = jwt.encode({"email": email}, "secret", algorithm="HS256")
+    return project_id, token
+
+def start_server(workers, cpus, log):
+    env = dict(os.environ, WEB_CONCURRENCY=str(workers), PORT=str(PORT), MONGODB_DATABASE=DATABASE_NAME)
+    # Workers write their logs straight to a file, so the measured path has no
+    # shared pipe or reader in this process.
+    proc = subprocess.Popen(
+        [sys.executable, "main.py"],
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=log,
+        preexec_fn=lambda: os.sched_setaffinity(0, cpus),
+    )
+    # Every worker logs this line once its lifespan (and MongoClient) is up.
+    deadline = time.time() + 60
+    while time.time() < deadline:
+        with open(log.name) as f:
+            if f.read().count("Application startup complete") >= workers:
+                return proc
+        if proc.poll() is not None:
+            break
+        time.sleep(0.2)
+    proc.terminate()
+    raise RuntimeError(f"Server with {workers} workers did not finish starting; see {log.name}")
+
+def hammer(args):
+    url, token, seconds = args
+    request = urllib.request.Request(url, headers={"Authorization": f"Bearer {token}"})
+    counts = {"ok": 0, "errors": 0}
+    lock = threading.Lock()
+    deadline = time.time() + seconds
+
+    def loop():
+        ok = errors = 0
+        while time.time() < deadline:
+            try:
+                with urllib.request.urlopen(request, timeout=10) as response:
+                    response.read()
+                ok += 1
+            except (urllib.error.URLError, OSError):
+                errors += 1
+        with lock:
+            counts["ok"] += ok
+            counts["errors"] += errors
+
+    threads = [threading.Thread(target=loop) for _ in range(THREADS_PER_CLIENT)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return counts["ok"], counts["errors"]
+
+def run(workers, server_cpus, client_cpus, project_id, token, seconds):
+    log = tempfile.NamedTemporaryFile(prefix="bench_workers_", suffix=".log", delete=False)
+    proc = start_server(workers, server_cpus, log)
+    try:
+        url = f"{BASE_URL}/api/v1/projects/{project_id}"
+        with Pool(len(client_cpus), initializer=os.sched_setaffinity, initargs=(0, client_cpus)) as pool:
+            pool.map(hammer, [(url, token, WARMUP_SECONDS)] * len(client_cpus))
+            results = pool.map(hammer, [(url, token, seconds)] * len(client_cpus))
+        ok = sum(r[0] for r in results)
+        errors = sum(r[1] for r in results)
+        return ok / seconds, errors
+    finally:
+        proc.terminate()
+        proc.wait()
+        log.close()
+        os.unlink(log.name)
+
+if __name__ == "__main__":
+    cpus = sorted(os.sched_getaffinity(0))
+    max_workers = int(sys.argv[1]) if len(sys.argv) > 1 else len(cpus) // 2
+    seconds = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+    if max_workers < 1 or max_workers >= len(cpus):
+        sys.exit(f"Need more CPUs than workers to leave room for the load generator ({len(cpus)} available).")
+    server_cpus, client_cpus = set(cpus[:max_workers]), set(cpus[max_workers:])
+
+    client = MongoClient(MONGO_URI)
+    client.drop_database(DATABASE_NAME)
+    try:
+        project_id, token = seed(client[DATABASE_NAME])
+        baseline = None
+        print(f"server CPUs: {len(server_cpus)}, client CPUs: {len(client_cpus)}")
+        print(f"{'workers':>8} {'req/s':>10} {'speedup':>8} {'errors':>8}")
+        for workers in sorted({1, 2, max_workers // 2, max_workers} - {0}):
+            if workers > max_workers:
+                continue
+            rps, errors = run(workers, server_cpus, client_cpus, project_id, token, seconds)
+            if baseline is None:
+                baseline = rps
+            # With no successful requests at the baseline (bad MONGODB_URI,
+            # failing auth, ...) there is no speedup to report.
+            speedup = f"{rps / baseline:.2f}x" if baseline else "n/a"
+            print(f"{workers:>8} {rps:>10.1f} {speedup:>8} {errors:>8}")
+    finally:
+        client.drop_database(DATABASE_NAME)
+        client.close()
@@ -7,30 +7,42 @@ load_dotenv()
 
 client = None
 db = None
+# PID of the process that created `client`. Each uvicorn worker is spawned as a
+# fresh process and connects in the lifespan, so this normally always matches.
+# It is a safeguard for fork-based servers (e.g. gunicorn with --preload),
+# where a worker could inherit a MongoClient, which is not fork-safe.
+client_pid = None
 
 def connect_to_mongo():
-    global client, db
+    global client, db, client_pid
     try:
         mongo_uri = os.getenv("MONGODB_URI")
         if not mongo_uri:
             raise ValueError("MONGODB_URI environment variable not set")
         client = MongoClient(mongo_uri)
         client.admin.command('ismaster')
-        db = client.get_database("testdb") # Or your specific database name
-        print("Successfully connected to MongoDB.")
+        db = client.get_database(os.getenv("MONGODB_DATABASE", "testdb"))
+        client_pid = os.getpid()
+        print(f"Successfully connected to MongoDB (pid {client_pid}).")
     except (ValueError, ConnectionFailure) as e:
         print(f"Error connecting to MongoDB: {e}")
         client = None
         db = None
+        client_pid = None
 
 def get_db():
-    if db is None:
+    if db is None or client_pid != os.getpid():
         # This is a fallback, but connect_to_mongo should be called on startup.
+        # It also replaces a client inherited across a fork.
         connect_to_mongo()
     return db
 
 def close_mongo_connection():
-    global client
-    if client:
+    global client, db, client_pid
+    # A client inherited across a fork belongs to the parent; leave it alone.
+    if client and client_pid == os.getpid():
         client.close()
-        print("MongoDB connection closed.")
\ No newline at end of file
+        print(f"MongoDB connection closed (pid {client_pid}).")
+    client = None
+    db = None
+    client_pid = None
@@ -58,6 +58,30 @@ async def catch_all(full_path: str):
     # This allows the frontend to handle routing
     return FileResponse(os.path.join(STATIC_DIR, "index.html"))
 
+def get_worker_count():
+    # WEB_CONCURRENCY is the conventional override; otherwise use one worker
+    # per CPU this process may run on, so bcrypt, serialization and generation
+    # can use every core without oversubscribing a restricted container.
+    workers = os.getenv("WEB_CONCURRENCY")
+    if workers:
+        try:
+            return max(1, int(workers))
+        except ValueError:
+            raise ValueError(f"WEB_CONCURRENCY must be an integer, got {workers!r}") from None
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
\ No newline at end of file
+    # Workers are spawned as fresh processes that import "main:app" themselves,
+    # so each one runs the lifespan above and opens its own MongoClient.
+    uvicorn.run(
+        "main:app",
+        host="0.0.0.0",
+        port=int(os.getenv("PORT", "8000")),
+        workers=get_worker_count(),
+        # On SIGTERM/SIGINT stop accepting connections and give in-flight
+        # requests this long to finish before the lifespan shutdown runs.
+        timeout_graceful_shutdown=int(os.getenv("GRACEFUL_SHUTDOWN_TIMEOUT", "30")),
+    )
\ No newline at end of file
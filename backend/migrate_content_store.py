@@ -0,0 +1,47 @@
+import os
+from pymongo import MongoClient
+from dotenv import load_dotenv
+from services import content_store
+
+# Moves inline lesson plan, worksheet and parent update bodies into the blob
+# store. Bodies below content_store.INLINE_THRESHOLD bytes stay inline. Safe to
+# re-run: documents that already hold a hash are skipped.
+# Usage: python migrate_content_store.py
+
+load_dotenv()
+
+MONGO_URI = os.getenv("MONGODB_URI", "mongodb://localhost:27017/")
+DATABASE_NAME = os.getenv("MONGODB_DATABASE", "testdb")
+
+BODY_FIELDS = (
+    ("lesson_plans", "content"),
+    ("worksheets", "content"),
+    ("parent_updates", "draftText"),
+)
+
+def migrate(db):
+    for collection_name, field in BODY_FIELDS:
+        collection = db[collection_name]
+        migrated = 0
+        for doc in collection.find({field: {"$type": "string"}}, {field: 1}):
+            if len(doc[field].encode("utf-8")) < content_store.INLINE_THRESHOLD:
+                continue
+            digest = content_store.store_content(db, doc[field])
+            result = collection.update_one(
+                {"_id": doc["_id"], field: doc[field]},
+                {"$set": {content_store.hash_field(field): digest}, "$unset": {field: ""}},
+            )
+            if result.modified_count:
+                migrated += 1
+            else:
+                # The document changed under us; drop the reference we took.
+                content_store.release_content(db, digest)
+        print(f"{collection_name}: migrated {migrated} documents.")
+
+if __name__ == "__main__":
+    client = MongoClient(MONGO_URI)
+    try:
+        migrate(client[DATABASE_NAME])
+    finally:
+        client.close()
+        print("MongoDB connection closed.")
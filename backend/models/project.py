@@ -38,6 +38,35 @@ class Project(BaseModel):
         }
 
 
+# The project list is served without fetching bodies from the blob store
+# (services/content_store); these keep every field except the body.
+class LessonPlanSummary(BaseModel):
+    id: Optional[str] = None
+    projectId: str
+    fileName: str
+    exportFormat: str = "pdf"
+
+class WorksheetSummary(BaseModel):
+    id: Optional[str] = None
+    projectId: str
+    fileName: str
+    exportFormat: str = "pdf"
+
+class ParentUpdateSummary(BaseModel):
+    id: Optional[str] = None
+    projectId: str
+    studentName: str
+    fileName: str
+
+class ProjectSummary(BaseModel):
+    id: Optional[str] = None
+    name: str
+    userId: str
+    lessonPlans: List[LessonPlanSummary] = []
+    worksheets: List[WorksheetSummary] = []
+    parentUpdates: List[ParentUpdateSummary] = []
+
+
 class CreateProject(BaseModel):
     name: str
 
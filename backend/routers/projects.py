@@ -1,12 +1,13 @@
 import logging
 from fastapi import APIRouter, Depends, HTTPException
 from typing import List
-from models.project import Project, CreateProject, LessonPlan, Worksheet, ParentUpdate
+from models.project import Project, ProjectSummary, CreateProject, LessonPlan, Worksheet, ParentUpdate
 from database import get_db
 from dependencies import get_current_user
 from bson import ObjectId
 from pydantic import BaseModel
 from services.content_generator import generate_mock_content, generate_mock_parent_updates
+from services import content_store
 
 router = APIRouter()
 
@@ -29,7 +30,7 @@ async def create_project(project_data: CreateProject, db=Depends(get_db), user:
         return created_project
     raise HTTPException(status_code=500, detail="Failed to create project")
 
-@router.get("/api/v1/projects", response_model=List[Project])
+@router.get("/api/v1/projects", response_model=List[ProjectSummary])
 async def get_projects(db=Depends(get_db), user: dict = Depends(get_current_user)):
     user_email = user["email"]
     db_user = db.users.find_one({"email": user_email})
@@ -39,31 +40,34 @@ async def get_projects(db=Depends(get_db), user: dict = Depends(get_current_user
     user_id = str(db_user["_id"])
     projects_cursor = db.projects.find({"userId": user_id})
     projects = []
+    # The list only carries document metadata, so bodies (inline or stored in
+    # the blob store) are left out; GET /api/v1/projects/{id} fetches them.
+    body_fields = {"content": 0, "contentHash": 0}
     for project_data in projects_cursor:
         project_id = str(project_data['_id'])
         project_data['id'] = project_id
         
         # Fetch related documents
-        lesson_plans = list(db.lesson_plans.find({"projectId": project_id}))
+        lesson_plans = list(db.lesson_plans.find({"projectId": project_id}, body_fields))
         for lp in lesson_plans:
             lp['id'] = str(lp['_id'])
             del lp['_id']
         project_data['lessonPlans'] = lesson_plans
 
-        worksheets = list(db.worksheets.find({"projectId": project_id}))
+        worksheets = list(db.worksheets.find({"projectId": project_id}, body_fields))
         for ws in worksheets:
             ws['id'] = str(ws['_id'])
             del ws['_id']
         project_data['worksheets'] = worksheets
 
-        parent_updates = list(db.parent_updates.find({"projectId": project_id}))
+        parent_updates = list(db.parent_updates.find({"projectId": project_id}, {"draftText": 0, "draftTextHash": 0}))
         for pu in parent_updates:
             pu['id'] = str(pu['_id'])
             del pu['_id']
         project_data['parentUpdates'] = parent_updates
         
         del project_data['_id']
-        projects.append(Project(**project_data))
+        projects.append(ProjectSummary(**project_data))
     return projects
 
 @router.get("/api/v1/projects/{project_id}", response_model=Project)
@@ -106,6 +110,12 @@ async def get_project(project_id: str, db=Depends(get_db), user: dict = Depends(
             pu['id'] = str(pu['_id'])
             del pu['_id']
             project['parentUpdates'].append(pu)
+
+        content_store.resolve(db, [
+            (project['lessonPlans'], "content"),
+            (project['worksheets'], "content"),
+            (project['parentUpdates'], "draftText"),
+        ])
         
         logging.info(f"Returning project data: {project}")
         return project
@@ -130,6 +140,19 @@ async def delete_project(project_id: str, db=Depends(get_db), user: dict = Depen
     if result.deleted_count == 0:
         raise HTTPException(status_code=404, detail="Project not found")
 
+    # Drop the project's documents and their references to stored bodies.
+    # Only the documents read here are deleted, so every released reference
+    # belongs to a deleted document.
+    for collection, field in (
+        (db.lesson_plans, "content"),
+        (db.worksheets, "content"),
+        (db.parent_updates, "draftText"),
+    ):
+        docs = list(collection.find({"projectId": project_id}, {content_store.hash_field(field): 1}))
+        if docs:
+            collection.delete_many({"_id": {"$in": [doc["_id"] for doc in docs]}})
+            content_store.release_all(db, docs, field)
+
     return {"message": "Project deleted successfully"}
 
 
@@ -193,7 +216,7 @@ async def generate_parent_updates(
             update_dict = parent_update.dict()
             logging.info(f"Inserting into 'parent_updates' collection: {update_dict}")
             
-            result = db.parent_updates.insert_one(update_dict)
+            result = content_store.insert_with_content(db, db.parent_updates, update_dict, "draftText")
             if result.inserted_id:
                 logging.info(f"Successfully inserted parent update with ID: {result.inserted_id}")
                 inserted_ids.append(str(result.inserted_id))
@@ -242,8 +265,8 @@ async def generate_lesson_plan(project_id: str, params: GenerationParams, db=Dep
         content=content["worksheet"]
     )
 
-    db.lesson_plans.insert_one(lesson_plan.dict())
-    db.worksheets.insert_one(worksheet.dict())
+    content_store.insert_with_content(db, db.lesson_plans, lesson_plan.dict(), "content")
+    content_store.insert_with_content(db, db.worksheets, worksheet.dict(), "content")
 
     return {
         "lesson_plan": lesson_plan.dict(),
@@ -0,0 +1,107 @@
+import hashlib
+import logging
+import zlib
+from collections import Counter
+from bson.binary import Binary
+from pymongo import UpdateOne
+
+# Generated bodies of at least INLINE_THRESHOLD bytes are stored once per
+# distinct text in the `blobs` collection, compressed and keyed by their
+# 32-byte SHA-256. Child documents then keep only the digest in a
+# `<field>Hash` key (e.g. `contentHash`, `draftTextHash`). Smaller bodies, such
+# as parent updates that differ only by name and score, stay inline: a
+# reference plus a blob document would take more space than the text itself.
+# zlib is used rather than zstd so the store needs no extra dependency.
+COMPRESSION_LEVEL = 6
+INLINE_THRESHOLD = 256
+
+def hash_field(field: str) -> str:
+    return f"{field}Hash"
+
+def content_hash(text: str) -> Binary:
+    return Binary(hashlib.sha256(text.encode("utf-8")).digest())
+
+def store_content(db, text: str) -> Binary:
+    digest = content_hash(text)
+    data = text.encode("utf-8")
+    # Upsert keeps this atomic: the first writer inserts the body, every writer
+    # (including the first) takes one reference.
+    db.blobs.update_one(
+        {"_id": digest},
+        {
+            "$setOnInsert": {
+                "data": Binary(zlib.compress(data, COMPRESSION_LEVEL)),
+                "size": len(data),
+            },
+            "$inc": {"refCount": 1},
+        },
+        upsert=True,
+    )
+    return digest
+
+def release_content(db, digest):
+    release_digests(db, [digest])
+
+def release_digests(db, digests):
+    """Drop one reference per entry in `digests` and delete unused blobs."""
+    counts = Counter(bytes(digest) for digest in digests)
+    if not counts:
+        return
+    db.blobs.bulk_write(
+        [UpdateOne({"_id": Binary(digest)}, {"$inc": {"refCount": -n}}) for digest, n in counts.items()],
+        ordered=False,
+    )
+    db.blobs.delete_many({"_id": {"$in": [Binary(digest) for digest in counts]}, "refCount": {"$lte": 0}})
+
+def release_all(db, docs, field: str):
+    key = hash_field(field)
+    release_digests(db, [doc[key] for doc in docs if doc.get(key)])
+
+def load_contents(db, digests) -> dict:
+    digests = {bytes(digest) for digest in digests}
+    if not digests:
+        return {}
+    return {
+        bytes(blob["_id"]): zlib.decompress(blob["data"]).decode("utf-8")
+        for blob in db.blobs.find({"_id": {"$in": [Binary(digest) for digest in digests]}})
+    }
+
+def externalize(db, doc: dict, field: str) -> dict:
+    """Replace doc[field] with a reference to its body in the blob store.
+
+    Bodies below INLINE_THRESHOLD bytes are left in the document.
+    """
+    key = hash_field(field)
+    doc.pop(key, None)
+    if len(doc[field].encode("utf-8")) >= INLINE_THRESHOLD:
+        doc[key] = store_content(db, doc.pop(field))
+    return doc
+
+def insert_with_content(db, collection, doc: dict, field: str):
+    """Externalize doc[field] and insert doc, releasing the body on failure."""
+    doc = externalize(db, doc, field)
+    try:
+        return collection.insert_one(doc)
+    except Exception:
+        if doc.get(hash_field(field)):
+            release_content(db, doc[hash_field(field)])
+        raise
+
+def resolve(db, groups) -> None:
+    """Fill in bodies for every (docs, field) pair in `groups`.
+
+    Each doc holding a `<field>Hash` gets doc[field] set and the hash removed;
+    documents with an inline body are left as they are. All bodies are fetched
+    with a single query. A reference to a missing blob is logged and resolved
+    to an empty body, so one lost blob does not fail the whole project.
+    """
+    digests = [doc[hash_field(field)] for docs, field in groups for doc in docs if doc.get(hash_field(field))]
+    bodies = load_contents(db, digests)
+    for docs, field in groups:
+        key = hash_field(field)
+        for doc in docs:
+            if doc.get(key):
+                digest = bytes(doc.pop(key))
+                if digest not in bodies:
+                    logging.warning(f"Blob {digest.hex()} for {field} of document {doc.get('_id', doc.get('id'))} is missing; returning an empty body.")
+                doc[field] = bodies.get(digest, "")
@@ -0,0 +1,192 @@
+import zlib
+import pytest
+from httpx import ASGITransport, AsyncClient
+from bson import ObjectId
+from bson.binary import Binary
+from pymongo import UpdateOne
+from main import app
+from database import get_db
+from dependencies import get_current_user
+from services import content_store
+from migrate_content_store import migrate
+
+LONG_TEXT = "# Lesson Plan: Fractions\n" + "- Activity: compare fractions.\n" * 20
+
+@pytest.fixture
+def db_mock(mocker):
+    mock_db = mocker.MagicMock()
+    mock_db.blobs = mocker.MagicMock()
+    mock_db.blobs.find.return_value = []
+    return mock_db
+
+def test_content_hash_is_32_byte_binary():
+    digest = content_store.content_hash(LONG_TEXT)
+    assert isinstance(digest, Binary)
+    assert len(digest) == 32
+
+def test_externalize_replaces_body_with_hash(db_mock):
+    doc = content_store.externalize(db_mock, {"projectId": "p1", "content": LONG_TEXT, "contentHash": None}, "content")
+
+    digest = content_store.content_hash(LONG_TEXT)
+    assert doc == {"projectId": "p1", "contentHash": digest}
+
+    query, update = db_mock.blobs.update_one.call_args.args
+    assert query == {"_id": digest}
+    assert update["$inc"] == {"refCount": 1}
+    assert zlib.decompress(update["$setOnInsert"]["data"]).decode("utf-8") == LONG_TEXT
+    assert db_mock.blobs.update_one.call_args.kwargs["upsert"] is True
+
+def test_externalize_keeps_small_body_inline(db_mock):
+    text = "Update for Alice: Their score was 90."
+    doc = content_store.externalize(db_mock, {"projectId": "p1", "draftText": text, "draftTextHash": None}, "draftText")
+
+    assert doc == {"projectId": "p1", "draftText": text}
+    db_mock.blobs.update_one.assert_not_called()
+
+def test_insert_with_content_releases_reference_on_failure(db_mock, mocker):
+    collection = mocker.MagicMock()
+    collection.insert_one.side_effect = RuntimeError("insert failed")
+
+    with pytest.raises(RuntimeError):
+        content_store.insert_with_content(db_mock, collection, {"projectId": "p1", "content": LONG_TEXT}, "content")
+
+    digest = content_store.content_hash(LONG_TEXT)
+    (ops,), _ = db_mock.blobs.bulk_write.call_args
+    assert ops == [UpdateOne({"_id": digest}, {"$inc": {"refCount": -1}})]
+
+def test_release_all_groups_by_digest(db_mock):
+    a = content_store.content_hash("a" * 300)
+    b = content_store.content_hash("b" * 300)
+    docs = [{"contentHash": a}, {"contentHash": b}, {"contentHash": a}, {"content": "inline"}]
+
+    content_store.release_all(db_mock, docs, "content")
+
+    db_mock.blobs.bulk_write.assert_called_once()
+    (ops,), _ = db_mock.blobs.bulk_write.call_args
+    assert ops == [
+        UpdateOne({"_id": a}, {"$inc": {"refCount": -2}}),
+        UpdateOne({"_id": b}, {"$inc": {"refCount": -1}}),
+    ]
+    # Blobs whose count reached zero are deleted in one query.
+    query = db_mock.blobs.delete_many.call_args.args[0]
+    assert query["refCount"] == {"$lte": 0}
+    assert sorted(bytes(d) for d in query["_id"]["$in"]) == sorted([bytes(a), bytes(b)])
+
+def test_release_all_without_references_is_a_no_op(db_mock):
+    content_store.release_all(db_mock, [{"content": "inline"}], "content")
+
+    db_mock.blobs.bulk_write.assert_not_called()
+    db_mock.blobs.delete_many.assert_not_called()
+
+def test_resolve_fetches_bodies_in_one_query(db_mock):
+    worksheet_text = "# Worksheet: Fractions\n" + "Exercise\n" * 40
+    lesson_digest = content_store.content_hash(LONG_TEXT)
+    worksheet_digest = content_store.content_hash(worksheet_text)
+    db_mock.blobs.find.return_value = [
+        {"_id": bytes(lesson_digest), "data": zlib.compress(LONG_TEXT.encode("utf-8"))},
+        {"_id": bytes(worksheet_digest), "data": zlib.compress(worksheet_text.encode("utf-8"))},
+    ]
+    lesson_plans = [{"fileName": "a.md", "contentHash": lesson_digest}, {"fileName": "b.md", "contentHash": lesson_digest}]
+    worksheets = [{"fileName": "w.md", "contentHash": worksheet_digest}]
+    parent_updates = [{"fileName": "p.txt", "draftText": "Update for Alice: Their score was 90."}]
+
+    content_store.resolve(db_mock, [(lesson_plans, "content"), (worksheets, "content"), (parent_updates, "draftText")])
+
+    db_mock.blobs.find.assert_called_once()
+    assert lesson_plans == [{"fileName": "a.md", "content": LONG_TEXT}, {"fileName": "b.md", "content": LONG_TEXT}]
+    assert worksheets == [{"fileName": "w.md", "content": worksheet_text}]
+    assert parent_updates[0]["draftText"] == "Update for Alice: Their score was 90."
+
+def test_resolve_missing_blob_falls_back_to_empty_body(db_mock, caplog):
+    digest = content_store.content_hash(LONG_TEXT)
+    lesson_plans = [{"id": "lp1", "fileName": "a.md", "contentHash": digest}]
+
+    content_store.resolve(db_mock, [(lesson_plans, "content")])
+
+    assert lesson_plans == [{"id": "lp1", "fileName": "a.md", "content": ""}]
+    assert bytes(digest).hex() in caplog.text
+
+def test_migrate_releases_reference_when_document_changed(db_mock, mocker):
+    doc_id = ObjectId()
+    collections = {name: mocker.MagicMock() for name in ("lesson_plans", "worksheets", "parent_updates")}
+    collections["lesson_plans"].find.return_value = [{"_id": doc_id, "content": LONG_TEXT}]
+    collections["lesson_plans"].update_one.return_value.modified_count = 0
+    for name in ("worksheets", "parent_updates"):
+        collections[name].find.return_value = []
+    db_mock.__getitem__.side_effect = collections.__getitem__
+
+    migrate(db_mock)
+
+    digest = content_store.content_hash(LONG_TEXT)
+    db_mock.blobs.update_one.assert_called_once()
+    (ops,), _ = db_mock.blobs.bulk_write.call_args
+    assert ops == [UpdateOne({"_id": digest}, {"$inc": {"refCount": -1}})]
+
+def test_migrate_skips_small_bodies(db_mock, mocker):
+    collections = {name: mocker.MagicMock() for name in ("lesson_plans", "worksheets", "parent_updates")}
+    collections["lesson_plans"].find.return_value = []
+    collections["worksheets"].find.return_value = []
+    collections["parent_updates"].find.return_value = [{"_id": ObjectId(), "draftText": "Update for Ben: Their score was 70."}]
+    db_mock.__getitem__.side_effect = collections.__getitem__
+
+    migrate(db_mock)
+
+    collections["parent_updates"].update_one.assert_not_called()
+    db_mock.blobs.update_one.assert_not_called()
+
+@pytest.mark.asyncio
+async def test_delete_project_releases_only_deleted_documents(db_mock):
+    app.dependency_overrides[get_db] = lambda: db_mock
+    app.dependency_overrides[get_current_user] = lambda: {"email": "test@example.com"}
+
+    user_id = str(ObjectId())
+    project_id = str(ObjectId())
+    digest = content_store.content_hash(LONG_TEXT)
+    lesson_ids = [ObjectId(), ObjectId()]
+    db_mock.users.find_one.return_value = {"_id": user_id, "email": "test@example.com"}
+    db_mock.projects.find_one.return_value = {"_id": ObjectId(project_id), "userId": user_id}
+    db_mock.projects.delete_one.return_value.deleted_count = 1
+    db_mock.lesson_plans.find.return_value = [{"_id": lesson_ids[0], "contentHash": digest}, {"_id": lesson_ids[1], "contentHash": digest}]
+    db_mock.worksheets.find.return_value = []
+    db_mock.parent_updates.find.return_value = [{"_id": ObjectId()}]
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
+        response = await ac.delete(f"/api/v1/projects/{project_id}")
+
+    assert response.status_code == 204
+    db_mock.lesson_plans.delete_many.assert_called_once_with({"_id": {"$in": lesson_ids}})
+    db_mock.worksheets.delete_many.assert_not_called()
+    db_mock.parent_updates.delete_many.assert_called_once()
+    db_mock.blobs.bulk_write.assert_called_once()
+    (ops,), _ = db_mock.blobs.bulk_write.call_args
+    assert ops == [UpdateOne({"_id": digest}, {"$inc": {"refCount": -2}})]
+
+    # Clean up overrides
+    app.dependency_overrides = {}
+
+@pytest.mark.asyncio
+async def test_get_projects_keeps_metadata_without_bodies(db_mock):
+    app.dependency_overrides[get_db] = lambda: db_mock
+    app.dependency_overrides[get_current_user] = lambda: {"email": "test@example.com"}
+
+    user_id = str(ObjectId())
+    project_id = ObjectId()
+    db_mock.users.find_one.return_value = {"_id": user_id, "email": "test@example.com"}
+    db_mock.projects.find.return_value = [{"_id": project_id, "name": "Science", "userId": user_id}]
+    db_mock.lesson_plans.find.return_value = [{"_id": ObjectId(), "projectId": str(project_id), "fileName": "lp.md", "exportFormat": "docx"}]
+    db_mock.worksheets.find.return_value = []
+    db_mock.parent_updates.find.return_value = [{"_id": ObjectId(), "projectId": str(project_id), "studentName": "Alice", "fileName": "Alice-ParentUpdate.txt"}]
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
+        response = await ac.get("/api/v1/projects")
+
+    assert response.status_code == 200
+    project = response.json()[0]
+    assert project["lessonPlans"][0]["exportFormat"] == "docx"
+    assert project["parentUpdates"][0]["studentName"] == "Alice"
+    assert "content" not in project["lessonPlans"][0]
+    assert "draftText" not in project["parentUpdates"][0]
+    db_mock.blobs.find.assert_not_called()
+
+    # Clean up overrides
+    app.dependency_overrides = {}
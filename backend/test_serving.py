@@ -0,0 +1,63 @@
+import os
+import pytest
+import database
+from main import get_worker_count
+
+def test_worker_count_env_override(monkeypatch):
+    monkeypatch.setenv("WEB_CONCURRENCY", "3")
+    assert get_worker_count() == 3
+
+def test_worker_count_at_least_one(monkeypatch):
+    monkeypatch.setenv("WEB_CONCURRENCY", "0")
+    assert get_worker_count() == 1
+    monkeypatch.setenv("WEB_CONCURRENCY", "-2")
+    assert get_worker_count() == 1
+
+def test_worker_count_rejects_non_integer(monkeypatch):
+    monkeypatch.setenv("WEB_CONCURRENCY", "auto")
+    with pytest.raises(ValueError, match="WEB_CONCURRENCY must be an integer"):
+        get_worker_count()
+
+def test_worker_count_uses_cpu_affinity(monkeypatch):
+    monkeypatch.delenv("WEB_CONCURRENCY", raising=False)
+    monkeypatch.setattr(os, "sched_getaffinity", lambda pid: {0, 1}, raising=False)
+    monkeypatch.setattr(os, "cpu_count", lambda: 16)
+    assert get_worker_count() == 2
+
+def test_worker_count_falls_back_to_cpu_count(monkeypatch):
+    monkeypatch.delenv("WEB_CONCURRENCY", raising=False)
+    monkeypatch.delattr(os, "sched_getaffinity", raising=False)
+    monkeypatch.setattr(os, "cpu_count", lambda: 4)
+    assert get_worker_count() == 4
+    monkeypatch.setattr(os, "cpu_count", lambda: None)
+    assert get_worker_count() == 1
+
+def test_get_db_reconnects_after_fork(mocker, monkeypatch):
+    inherited_db = mocker.MagicMock()
+    monkeypatch.setattr(database, "db", inherited_db)
+    monkeypatch.setattr(database, "client_pid", os.getpid() + 1)
+    connect = mocker.patch("database.connect_to_mongo")
+
+    database.get_db()
+
+    connect.assert_called_once_with()
+
+def test_get_db_reuses_client_in_same_process(mocker, monkeypatch):
+    current_db = mocker.MagicMock()
+    monkeypatch.setattr(database, "db", current_db)
+    monkeypatch.setattr(database, "client_pid", os.getpid())
+    connect = mocker.patch("database.connect_to_mongo")
+
+    assert database.get_db() is current_db
+    connect.assert_not_called()
+
+def test_close_leaves_inherited_client_open(mocker, monkeypatch):
+    inherited_client = mocker.MagicMock()
+    monkeypatch.setattr(database, "client", inherited_client)
+    monkeypatch.setattr(database, "db", mocker.MagicMock())
+    monkeypatch.setattr(database, "client_pid", os.getpid() + 1)
+
+    database.close_mongo_connection()
+
+    inherited_client.close.assert_not_called()
+    assert database.client is None and database.db is None